@@ -3,11 +3,14 @@ Pipeline de traitement audio configurable
 Permet d'appliquer des effets audio et de générer des fichiers augmentés
 """
 
-import yaml
 import os
-from pydub import AudioSegment
-from pydub.effects import normalize, compress_dynamic_range
-from pydub.playback import play
+import copy
+import subprocess
+import wave
+import numpy as np
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, wraps
 import logging
 
 # Configuration du logging
@@ -15,9 +18,181 @@ logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=32)
+def _parse_yaml(abspath, mtime):
+    """
+    Parse un fichier YAML, mis en cache par (chemin absolu, date de modification)
+    
+    Args:
+        abspath (str): Chemin absolu du fichier
+        mtime (float): Date de modification, invalide le cache si le fichier change
+        
+    Returns:
+        dict: Contenu du fichier
+    """
+    import yaml
+    
+    # Chargeur YAML en C (libyaml) si disponible, sinon chargeur Python
+    try:
+        from yaml import CSafeLoader as SafeLoader
+    except ImportError:
+        from yaml import SafeLoader
+    
+    with open(abspath, 'r', encoding='utf-8') as file:
+        return yaml.load(file, Loader=SafeLoader)
+
+
+def _decode_segment(path, mtime, size):
+    """
+    Décode un fichier audio avec ffmpeg
+    
+    Args:
+        path (str): Chemin absolu du fichier
+        mtime (float): Date de modification (clé de cache)
+        size (int): Taille en octets (clé de cache)
+        
+    Returns:
+        AudioSegment: Audio décodé
+    """
+    from pydub import AudioSegment
+    
+    return AudioSegment.from_file(path)
+
+
+# Cache des fichiers décodés, partagé entre les pipelines d'un même processus
+_load_segment = lru_cache(maxsize=64)(_decode_segment)
+
+
+def _set_segment_cache_size(maxsize):
+    """
+    Redimensionne le cache des fichiers décodés (le vide si la taille change)
+    
+    Args:
+        maxsize (int): Nombre maximal de fichiers gardés en mémoire
+    """
+    global _load_segment
+    if _load_segment.cache_parameters()['maxsize'] != maxsize:
+        _load_segment = lru_cache(maxsize=maxsize)(_decode_segment)
+
+
+def _apply_gain(samples, factor):
+    """
+    Multiplie des échantillons float32 sur place, comme audioop.mul:
+    le résultat est écrêté à la plage int16 et arrondi à l'entier inférieur
+    
+    Args:
+        samples (np.ndarray): Échantillons float32, modifiés sur place
+        factor (float): Facteur d'amplitude
+    """
+    samples *= factor
+    np.clip(samples, -32768, 32767, out=samples)
+    np.floor(samples, out=samples)
+
+
+# Taille maximale des données d'un WAV: les tailles RIFF sont sur 32 bits
+_WAV_MAX_DATA_BYTES = 0xFFFFFFFF - 36
+
+# Gain de départ/fin des fondus de pydub (-120dB)
+_FADE_SILENCE = 10 ** (-120 / 20)
+
+
+def _fade_ramp(first, last, n, rising):
+    """
+    Gains des trames [first, last) d'un fondu linéaire de n trames
+    
+    Args:
+        first (int): Première trame, comptée depuis le début du fondu
+        last (int): Trame de fin (exclue)
+        n (int): Durée totale du fondu en trames
+        rising (bool): True pour un fondu d'entrée, False pour une sortie
+        
+    Returns:
+        np.ndarray: Gains float32 de forme (last - first, 1)
+    """
+    progress = np.arange(first, last, dtype=np.float32) / n
+    if rising:
+        ramp = _FADE_SILENCE + (1.0 - _FADE_SILENCE) * progress
+    else:
+        ramp = 1.0 - (1.0 - _FADE_SILENCE) * progress
+    return ramp[:, None]
+
+
+def _freeze(params):
+    """
+    Rend des paramètres d'effet hashables (dict -> frozenset, list -> tuple)
+    
+    Args:
+        params: Paramètres d'un effet (dict) ou d'une chaîne d'effets (list)
+        
+    Returns:
+        Valeur hashable équivalente
+    """
+    if isinstance(params, dict):
+        return frozenset((key, _freeze(value)) for key, value in params.items())
+    if isinstance(params, list):
+        return tuple(_freeze(value) for value in params)
+    return params
+
+
+def _memo_effect(method):
+    """
+    Mémorise le résultat d'un effet par (segment, effet, paramètres)
+    
+    Désactivé par défaut: le cache ne sert que si un même segment repasse
+    plusieurs fois par les effets (augmentation en lot, usage en bibliothèque).
+    Il est activé par effect_cache_size et limité à ce nombre d'entrées (LRU).
+    Le segment source est gardé dans le cache avec le résultat, pour que son
+    id() ne puisse pas être réattribué à un autre segment tant que l'entrée existe.
+    
+    Args:
+        method (callable): Méthode (self, audio, params) -> AudioSegment
+        
+    Returns:
+        callable: Méthode mémorisée
+    """
+    @wraps(method)
+    def wrapper(self, audio, params):
+        if self.effect_cache_size <= 0:
+            return method(self, audio, params)
+        try:
+            key = (id(audio), method.__name__, _freeze(params))
+            hash(key)
+        except TypeError:
+            # Paramètres non hashables: pas de mise en cache
+            return method(self, audio, params)
+        
+        cached = self._effect_cache.get(key)
+        if cached is not None:
+            self._effect_cache.move_to_end(key)
+            return cached[1]
+        result = method(self, audio, params)
+        self._effect_cache[key] = (audio, result)
+        while len(self._effect_cache) > self.effect_cache_size:
+            self._effect_cache.popitem(last=False)
+        return result
+    
+    return wrapper
+
+
 class AudioPipeline:
     """Classe principale pour le pipeline de traitement audio"""
     
+    # Effets disponibles: type -> nom de la méthode qui l'applique
+    _EFFECT_METHODS = {
+        'volume': 'apply_volume_effect',
+        'speed': 'apply_speed_effect',
+        'fade': 'apply_fade_effect',
+        'reverse': 'apply_reverse_effect',
+        'normalize': 'apply_normalize_effect',
+        'repeat': 'apply_repeat_effect',
+    }
+    
+    # Effets linéaires sur les échantillons, applicables en une seule passe NumPy
+    _FUSED_EFFECTS = {'volume', 'fade', 'normalize', 'repeat', 'reverse'}
+    
+    # Effets applicables bloc par bloc en mode streaming
+    _STREAM_EFFECTS = {'volume', 'fade'}
+    
     def __init__(self, config_file='config.yaml'):
         """
         Initialise le pipeline avec un fichier de configuration
@@ -28,8 +203,15 @@ class AudioPipeline:
         self.config = self.load_config(config_file)
         self.audio_segments = []
         self.mix_segments = []
+        self.mix_placements = []
         self.concatenate_segments = []
         self.result = None
+        # Résultats d'effets déjà calculés (LRU, désactivé si taille 0), vidé à la fin de run()
+        self.effect_cache_size = self.config.get('effect_cache_size', 0)
+        self._effect_cache = OrderedDict()
+        # Méthodes d'effets résolues une seule fois
+        self.effect_functions = {name: getattr(self, method)
+                                 for name, method in self._EFFECT_METHODS.items()}
         
     def load_config(self, config_file):
         """
@@ -41,16 +223,19 @@ class AudioPipeline:
         Returns:
             dict: Configuration chargée
         """
+        import yaml
+        
         try:
-            with open(config_file, 'r', encoding='utf-8') as file:
-                config = yaml.safe_load(file)
-                logger.info(f"Configuration chargée depuis {config_file}")
-                return config
+            abspath = os.path.abspath(config_file)
+            # Copie pour que le dict en cache ne soit jamais modifié
+            config = copy.deepcopy(_parse_yaml(abspath, os.path.getmtime(abspath)))
+            logger.info("Configuration chargée depuis %s", config_file)
+            return config
         except FileNotFoundError:
-            logger.error(f"Fichier de configuration {config_file} introuvable")
+            logger.error("Fichier de configuration %s introuvable", config_file)
             raise
         except yaml.YAMLError as e:
-            logger.error(f"Erreur lors du parsing YAML: {e}")
+            logger.error("Erreur lors du parsing YAML: %s", e)
             raise
     
     def load_audio_files(self):
@@ -59,45 +244,174 @@ class AudioPipeline:
         Supporte mix_files, concatenate_files, et audio_files (legacy)
         """
         input_folder = self.config.get('input_folder', 'input_audio')
+        # Entrées de mix_files: "a.wav" ou {file: a.wav, offset_ms: 500, gain_db: -3}
+        mix_entries = [entry if isinstance(entry, dict) else {'file': entry}
+                       for entry in self.config.get('mix_files', [])]
+        if any('file' not in entry for entry in mix_entries):
+            logger.error("Chaque entrée de mix_files doit indiquer un fichier ('file')")
+            raise ValueError("Entrée de mix_files sans clé 'file'")
+        mix_files = [entry['file'] for entry in mix_entries]
+        concatenate_files = self.config.get('concatenate_files', [])
+        # Support de l'ancien format (audio_files) pour compatibilité
+        audio_files = self.config.get('audio_files', [])
+        if mix_files or concatenate_files:
+            audio_files = []
         
-        if not os.path.exists(input_folder):
-            logger.error(f"Le dossier {input_folder} n'existe pas")
-            raise FileNotFoundError(f"Dossier {input_folder} introuvable")
+        # Vérifier tous les fichiers avant de lancer le moindre décodage
+        files = self._resolve_files(input_folder, mix_files + concatenate_files + audio_files)
         
-        # Charger les fichiers à mixer
-        mix_files = self.config.get('mix_files', [])
-        for audio_file in mix_files:
-            file_path = os.path.join(input_folder, audio_file)
-            try:
-                audio = AudioSegment.from_file(file_path)
-                self.mix_segments.append(audio)
-                logger.info(f"Fichier pour mixage chargé: {audio_file} ({len(audio)}ms, {audio.frame_rate}Hz)")
-            except Exception as e:
-                logger.error(f"Erreur lors du chargement de {audio_file}: {e}")
+        _set_segment_cache_size(self.config.get('cache_size', 64))
         
-        # Charger les fichiers à concaténer
-        concatenate_files = self.config.get('concatenate_files', [])
+        # Décoder en une fois les fichiers des trois listes, sur le même pool
+        decoded = dict(self._decode_all(files, mix_files + concatenate_files + audio_files))
+        
+        # Répartir les fichiers à mixer
+        for entry in mix_entries:
+            audio_file = entry['file']
+            audio = decoded.get(audio_file)
+            if audio is None:
+                continue
+            self.mix_segments.append(audio)
+            self.mix_placements.append((entry.get('offset_ms', 0), entry.get('gain_db', 0)))
+            logger.info("Fichier pour mixage chargé: %s (%dms, %dHz)", audio_file, len(audio), audio.frame_rate)
+        
+        # Répartir les fichiers à concaténer
         for audio_file in concatenate_files:
-            file_path = os.path.join(input_folder, audio_file)
+            audio = decoded.get(audio_file)
+            if audio is None:
+                continue
+            self.concatenate_segments.append(audio)
+            logger.info("Fichier pour concaténation chargé: %s (%dms, %dHz)", audio_file, len(audio), audio.frame_rate)
+        
+        # Répartir les fichiers de l'ancien format
+        for audio_file in audio_files:
+            audio = decoded.get(audio_file)
+            if audio is None:
+                continue
+            self.audio_segments.append(audio)
+            logger.info("Fichier chargé: %s (%dms, %dHz)", audio_file, len(audio), audio.frame_rate)
+        
+        self._uniformize_segments()
+    
+    def _uniformize_segments(self):
+        """
+        Convertit une seule fois tous les segments chargés au même format
+        
+        Fréquence cible: target_rate de la configuration, sinon la plus haute
+        des entrées. Canaux: le maximum des entrées. Échantillons 16 bits.
+        Le mix, la concaténation et leur combinaison n'ont ensuite plus
+        aucun rééchantillonnage à faire.
+        """
+        segments = self.mix_segments + self.concatenate_segments + self.audio_segments
+        if not segments:
+            return
+        
+        frame_rate = self.config.get('target_rate') or max(seg.frame_rate for seg in segments)
+        channels = max(seg.channels for seg in segments)
+        logger.info("Format commun: %dHz, %d canaux, 16 bits", frame_rate, channels)
+        
+        # Un même fichier chargé plusieurs fois n'est converti qu'une fois
+        converted = {}
+        
+        def convert(seg):
+            if id(seg) not in converted:
+                converted[id(seg)] = seg.set_frame_rate(frame_rate).set_channels(channels).set_sample_width(2)
+            return converted[id(seg)]
+        
+        self.mix_segments = [convert(seg) for seg in self.mix_segments]
+        self.concatenate_segments = [convert(seg) for seg in self.concatenate_segments]
+        self.audio_segments = [convert(seg) for seg in self.audio_segments]
+    
+    def _resolve_files(self, input_folder, audio_files):
+        """
+        Localise les fichiers demandés avec un seul parcours du dossier d'entrée
+        
+        Args:
+            input_folder (str): Dossier contenant les fichiers
+            audio_files (list): Noms des fichiers (éventuellement avec sous-dossier)
+            
+        Returns:
+            dict: audio_file -> (chemin absolu, os.stat_result)
+            
+        Raises:
+            FileNotFoundError: Si le dossier ou au moins un fichier est introuvable
+        """
+        try:
+            with os.scandir(input_folder) as entries:
+                available = {entry.name: entry for entry in entries if entry.is_file()}
+        except FileNotFoundError:
+            logger.error("Le dossier %s n'existe pas", input_folder)
+            raise FileNotFoundError(f"Dossier {input_folder} introuvable")
+        except OSError as e:
+            # Chemin qui n'est pas un dossier, droits insuffisants...
+            logger.error("Le dossier %s est inaccessible: %s", input_folder, e)
+            raise
+        
+        files = {}
+        missing = []
+        for audio_file in audio_files:
+            if audio_file in files:
+                continue
+            entry = available.get(audio_file)
             try:
-                audio = AudioSegment.from_file(file_path)
-                self.concatenate_segments.append(audio)
-                logger.info(f"Fichier pour concaténation chargé: {audio_file} ({len(audio)}ms, {audio.frame_rate}Hz)")
-            except Exception as e:
-                logger.error(f"Erreur lors du chargement de {audio_file}: {e}")
+                if entry is not None:
+                    files[audio_file] = (os.path.abspath(entry.path), entry.stat())
+                else:
+                    file_path = os.path.abspath(os.path.join(input_folder, audio_file))
+                    files[audio_file] = (file_path, os.stat(file_path))
+            except OSError:
+                missing.append(audio_file)
         
-        # Support de l'ancien format (audio_files) pour compatibilité
-        audio_files = self.config.get('audio_files', [])
-        if audio_files and not mix_files and not concatenate_files:
-            for audio_file in audio_files:
-                file_path = os.path.join(input_folder, audio_file)
-                try:
-                    audio = AudioSegment.from_file(file_path)
-                    self.audio_segments.append(audio)
-                    logger.info(f"Fichier chargé: {audio_file} ({len(audio)}ms, {audio.frame_rate}Hz)")
-                except Exception as e:
-                    logger.error(f"Erreur lors du chargement de {audio_file}: {e}")
+        if missing:
+            logger.error("Fichiers introuvables dans %s: %s", input_folder, ', '.join(missing))
+            raise FileNotFoundError(f"Fichiers introuvables dans {input_folder}: {', '.join(missing)}")
+        
+        return files
+    
+    def _decode(self, audio_file, file_path, st):
+        """
+        Décode un fichier audio (appelé depuis un thread)
+        
+        Args:
+            audio_file (str): Nom du fichier, tel qu'écrit dans la configuration
+            file_path (str): Chemin absolu du fichier
+            st (os.stat_result): Informations du fichier (clé de cache)
+            
+        Returns:
+            tuple: (audio_file, AudioSegment), ou (audio_file, None) en cas d'erreur
+        """
+        try:
+            return audio_file, _load_segment(file_path, st.st_mtime, st.st_size)
+        except Exception as e:
+            logger.error("Erreur lors du chargement de %s: %s", audio_file, e)
+            return audio_file, None
     
+    def _decode_all(self, files, audio_files):
+        """
+        Décode plusieurs fichiers en parallèle (un processus ffmpeg par fichier)
+        
+        Chaque nom n'est décodé qu'une fois, même s'il est listé plusieurs fois:
+        le cache ne fusionne pas deux décodages lancés en même temps.
+        
+        Args:
+            files (dict): Fichiers localisés par _resolve_files
+            audio_files (list): Noms des fichiers à décoder
+            
+        Returns:
+            list: Couples (audio_file, AudioSegment) dans l'ordre d'entrée,
+                  doublons compris; les fichiers en erreur sont ignorés
+        """
+        if not audio_files:
+            return []
+        
+        unique_files = list(dict.fromkeys(audio_files))
+        max_workers = min(8, os.cpu_count() or 1, len(unique_files))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            decoded = dict(executor.map(lambda f: self._decode(f, *files[f]), unique_files))
+        return [(audio_file, decoded[audio_file]) for audio_file in audio_files
+                if decoded[audio_file] is not None]
+    
+    @_memo_effect
     def apply_volume_effect(self, audio, params):
         """
         Applique un changement de volume
@@ -110,29 +424,36 @@ class AudioPipeline:
             AudioSegment: Audio modifié
         """
         gain = params.get('gain', 0)
-        logger.info(f"Application de l'effet volume: {gain}dB")
+        logger.info("Application de l'effet volume: %sdB", gain)
         return audio + gain
     
+    @_memo_effect
     def apply_speed_effect(self, audio, params):
         """
         Modifie la vitesse de lecture
         
         Args:
             audio (AudioSegment): Segment audio à modifier
-            params (dict): Paramètres (factor: 1.0 = normal, 2.0 = 2x plus rapide)
+            params (dict): Paramètres (factor: 1.0 = normal, 2.0 = 2x plus rapide,
+                           preserve_rate: rééchantillonner au frame_rate d'origine)
             
         Returns:
             AudioSegment: Audio modifié
         """
         factor = params.get('factor', 1.0)
-        logger.info(f"Application de l'effet vitesse: x{factor}")
+        preserve_rate = params.get('preserve_rate', True)
+        logger.info("Application de l'effet vitesse: x%s", factor)
         
         # Modifier la vitesse en changeant le frame_rate
         sound_with_altered_frame_rate = audio._spawn(audio.raw_data, 
                                                       overrides={'frame_rate': int(audio.frame_rate * factor)})
+        if not preserve_rate:
+            # Pas de rééchantillonnage: la sortie garde le nouveau frame_rate
+            return sound_with_altered_frame_rate
         # Reconvertir au frame_rate original pour maintenir la compatibilité
         return sound_with_altered_frame_rate.set_frame_rate(audio.frame_rate)
     
+    @_memo_effect
     def apply_fade_effect(self, audio, params):
         """
         Applique un fondu en entrée et/ou sortie
@@ -150,13 +471,14 @@ class AudioPipeline:
         result = audio
         if fade_in > 0:
             result = result.fade_in(fade_in)
-            logger.info(f"Fade in appliqué: {fade_in}ms")
+            logger.info("Fade in appliqué: %sms", fade_in)
         if fade_out > 0:
             result = result.fade_out(fade_out)
-            logger.info(f"Fade out appliqué: {fade_out}ms")
+            logger.info("Fade out appliqué: %sms", fade_out)
         
         return result
     
+    @_memo_effect
     def apply_reverse_effect(self, audio, params):
         """
         Inverse l'audio
@@ -169,8 +491,12 @@ class AudioPipeline:
             AudioSegment: Audio inversé
         """
         logger.info("Application de l'effet reverse")
-        return audio.reverse()
+        # Inverser les trames, pas les échantillons (audio.reverse() échange
+        # les canaux en stéréo), comme le fait _apply_effects_fused
+        frames = np.frombuffer(audio.raw_data, dtype=np.uint8).reshape(-1, audio.frame_width)
+        return audio._spawn(frames[::-1].tobytes())
     
+    @_memo_effect
     def apply_normalize_effect(self, audio, params):
         """
         Normalise le volume audio
@@ -183,9 +509,12 @@ class AudioPipeline:
             AudioSegment: Audio normalisé
         """
         headroom = params.get('headroom', 0.1)
-        logger.info(f"Normalisation avec headroom: {headroom}dB")
+        logger.info("Normalisation avec headroom: %sdB", headroom)
+        from pydub.effects import normalize
+        
         return normalize(audio, headroom=headroom)
     
+    @_memo_effect
     def apply_repeat_effect(self, audio, params):
         """
         Répète l'audio un certain nombre de fois
@@ -198,8 +527,13 @@ class AudioPipeline:
             AudioSegment: Audio répété
         """
         times = params.get('times', 1)
-        logger.info(f"Répétition de l'audio: {times} fois")
-        return audio * times
+        logger.info("Répétition de l'audio: %s fois", times)
+        
+        times = int(times)
+        if times < 1:
+            return audio._spawn(b"")
+        # Une seule allocation pour les données répétées
+        return audio._spawn(audio.raw_data * times)
     
     def mix_audio_files(self):
         """
@@ -212,16 +546,61 @@ class AudioPipeline:
             logger.warning("Aucun fichier audio à mixer")
             return None
         
-        logger.info(f"Mixage de {len(self.audio_segments)} fichiers audio")
+        logger.info("Mixage de %d fichiers audio", len(self.audio_segments))
+        
+        return self._mix_numpy(self.audio_segments)
+    
+    def _mix_numpy(self, segments, placements=None):
+        """
+        Superpose des segments en une seule passe NumPy
+        
+        Sans décalage, équivalent à des `overlay` successifs sur le premier
+        segment (dont la durée est conservée). Si un segment est décalé, la
+        durée du résultat couvre la fin du dernier segment. La somme se fait
+        dans un accumulateur int32 et n'est écrêtée qu'une fois à la fin.
+        
+        Args:
+            segments (list): Segments audio à superposer
+            placements (list): Couples (offset_ms, gain_db) par segment (optionnel)
+            
+        Returns:
+            AudioSegment: Audio mixé
+        """
+        frame_rate = max(seg.frame_rate for seg in segments)
+        channels = max(seg.channels for seg in segments)
         
-        # Prendre le premier fichier comme base
-        mixed = self.audio_segments[0]
+        arrays = []
+        for seg in segments:
+            seg = seg.set_frame_rate(frame_rate).set_channels(channels).set_sample_width(2)
+            arrays.append(np.frombuffer(seg.raw_data, dtype=np.int16))
         
-        # Superposer les autres fichiers
-        for audio in self.audio_segments[1:]:
-            mixed = mixed.overlay(audio)
+        if placements is None:
+            placements = [(0, 0)] * len(segments)
+        # Position de départ de chaque segment, en échantillons entrelacés
+        offsets = [max(0, int(offset_ms * frame_rate / 1000)) * channels
+                   for offset_ms, gain_db in placements]
         
-        return mixed
+        if any(offsets):
+            length = max(offset + len(arr) for offset, arr in zip(offsets, arrays))
+        else:
+            # Comme overlay(), la durée du résultat est celle du premier segment
+            length = len(arrays[0])
+        
+        acc = np.zeros(length, dtype=np.int32)
+        for arr, offset, (offset_ms, gain_db) in zip(arrays, offsets, placements):
+            n = max(0, min(len(arr), length - offset))
+            if gain_db:
+                acc[offset:offset + n] += np.rint(arr[:n] * 10 ** (gain_db / 20)).astype(np.int32)
+            else:
+                acc[offset:offset + n] += arr[:n]
+        
+        mixed = np.clip(acc, -32768, 32767).astype(np.int16)
+        return segments[0]._spawn(mixed.tobytes(), overrides={
+            'frame_rate': frame_rate,
+            'channels': channels,
+            'sample_width': 2,
+            'frame_width': channels * 2,
+        })
     
     def concatenate_audio_files(self):
         """
@@ -234,13 +613,38 @@ class AudioPipeline:
             logger.warning("Aucun fichier audio à concaténer")
             return None
         
-        logger.info(f"Concaténation de {len(self.audio_segments)} fichiers audio")
+        logger.info("Concaténation de %d fichiers audio", len(self.audio_segments))
+        
+        return self._concatenate(self.audio_segments)
+    
+    def _concatenate(self, segments):
+        """
+        Concatène des segments en une seule copie des échantillons
         
-        result = self.audio_segments[0]
-        for audio in self.audio_segments[1:]:
-            result += audio
+        `a + b` recopie tout le tampon accumulé à chaque itération (O(N²)),
+        on harmonise donc les formats puis on joint les données brutes d'un coup.
         
-        return result
+        Args:
+            segments (list): Segments audio à concaténer
+            
+        Returns:
+            AudioSegment: Audio concaténé
+        """
+        frame_rate = max(seg.frame_rate for seg in segments)
+        channels = max(seg.channels for seg in segments)
+        sample_width = max(seg.sample_width for seg in segments)
+        
+        parts = []
+        for seg in segments:
+            seg = seg.set_frame_rate(frame_rate).set_channels(channels).set_sample_width(sample_width)
+            parts.append(seg.raw_data)
+        
+        return segments[0]._spawn(b"".join(parts), overrides={
+            'frame_rate': frame_rate,
+            'channels': channels,
+            'sample_width': sample_width,
+            'frame_width': channels * sample_width,
+        })
     
     def apply_effects(self, audio):
         """
@@ -255,25 +659,107 @@ class AudioPipeline:
         effects = self.config.get('effects', [])
         result = audio
         
-        # Dictionnaire des effets disponibles
-        effect_functions = {
-            'volume': self.apply_volume_effect,
-            'speed': self.apply_speed_effect,
-            'fade': self.apply_fade_effect,
-            'reverse': self.apply_reverse_effect,
-            'normalize': self.apply_normalize_effect,
-            'repeat': self.apply_repeat_effect,
-        }
+        # Chaîne entièrement fusionnable: une seule passe sur les échantillons
+        if (effects and audio.sample_width == 2
+                and all(effect.get('type') in self._FUSED_EFFECTS for effect in effects)):
+            return self._apply_effects_fused(audio, effects)
         
         for effect in effects:
             effect_type = effect.get('type')
-            if effect_type in effect_functions:
-                result = effect_functions[effect_type](result, effect)
-            else:
-                logger.warning(f"Effet inconnu: {effect_type}")
+            effect_function = self.effect_functions.get(effect_type)
+            if effect_function is None:
+                logger.warning("Effet inconnu: %s", effect_type)
+                continue
+            result = effect_function(result, effect)
         
         return result
     
+    @_memo_effect
+    def _apply_effects_fused(self, audio, effects):
+        """
+        Applique une chaîne d'effets volume/fade/normalize/repeat/reverse
+        en une seule passe NumPy (float32), sans segment intermédiaire
+        
+        Args:
+            audio (AudioSegment): Segment audio 16 bits à traiter
+            effects (list): Effets à appliquer, tous dans _FUSED_EFFECTS
+            
+        Returns:
+            AudioSegment: Audio avec effets appliqués
+        """
+        samples = np.frombuffer(audio.raw_data, dtype=np.int16).astype(np.float32)
+        samples = samples.reshape(-1, audio.channels)
+        
+        for effect in effects:
+            effect_type = effect.get('type')
+            
+            if effect_type == 'volume':
+                logger.info("Application de l'effet volume: %sdB", effect.get('gain', 0))
+                self._apply_block_effect(samples, effect, audio.frame_rate, 0, len(samples))
+            
+            elif effect_type == 'fade':
+                self._apply_block_effect(samples, effect, audio.frame_rate, 0, len(samples))
+                if effect.get('fade_in', 0) > 0:
+                    logger.info("Fade in appliqué: %sms", effect['fade_in'])
+                if effect.get('fade_out', 0) > 0:
+                    logger.info("Fade out appliqué: %sms", effect['fade_out'])
+            
+            elif effect_type == 'normalize':
+                headroom = effect.get('headroom', 0.1)
+                logger.info("Normalisation avec headroom: %sdB", headroom)
+                peak = np.abs(samples).max() if samples.size else 0
+                # Audio silencieux: rien à normaliser
+                if peak > 0:
+                    _apply_gain(samples, 32768 * 10 ** (-headroom / 20) / peak)
+            
+            elif effect_type == 'repeat':
+                times = effect.get('times', 1)
+                logger.info("Répétition de l'audio: %s fois", times)
+                samples = np.tile(samples, (max(0, int(times)), 1))
+            
+            elif effect_type == 'reverse':
+                logger.info("Application de l'effet reverse")
+                # Inverser les trames, pas les échantillons, pour garder les canaux
+                samples = samples[::-1]
+        
+        result = np.clip(samples, -32768, 32767).astype(np.int16)
+        return audio._spawn(result.tobytes())
+    
+    def _apply_block_effect(self, samples, effect, frame_rate, start, total):
+        """
+        Applique sur place un effet volume ou fade à un bloc d'échantillons
+        
+        Noyau partagé par _apply_effects_fused (bloc = signal entier) et
+        run_stream (un bloc par lecture).
+        
+        Args:
+            samples (np.ndarray): Bloc float32 (trames, canaux), modifié sur place
+            effect (dict): Effet 'volume' ou 'fade'
+            frame_rate (int): Fréquence d'échantillonnage
+            start (int): Indice dans le signal de la première trame du bloc
+            total (int): Nombre total de trames du signal, ou None s'il n'est pas
+                         encore connu (le bloc doit alors précéder tout fondu de sortie)
+        """
+        effect_type = effect.get('type')
+        
+        if effect_type == 'volume':
+            _apply_gain(samples, 10 ** (effect.get('gain', 0) / 20))
+        
+        elif effect_type == 'fade':
+            end = start + len(samples)
+            n = int(effect.get('fade_in', 0) * frame_rate / 1000)
+            if n > 0 and start < n:
+                stop = min(n, end)
+                samples[:stop - start] *= _fade_ramp(start, stop, n, rising=True)
+            
+            n = int(effect.get('fade_out', 0) * frame_rate / 1000)
+            if n > 0 and total is not None:
+                n = min(n, total)
+                fade_start = max(total - n, start)
+                if fade_start < end:
+                    samples[fade_start - start:] *= _fade_ramp(fade_start - (total - n), end - (total - n),
+                                                               n, rising=False)
+    
     def save_audio(self, audio, output_name='result'):
         """
         Sauvegarde l'audio dans les formats spécifiés
@@ -288,22 +774,68 @@ class AudioPipeline:
         # Créer le dossier de sortie s'il n'existe pas
         if not os.path.exists(output_folder):
             os.makedirs(output_folder)
-            logger.info(f"Dossier de sortie créé: {output_folder}")
+            logger.info("Dossier de sortie créé: %s", output_folder)
         
-        for fmt in output_formats:
-            output_path = os.path.join(output_folder, f"{output_name}.{fmt}")
-            try:
-                # Paramètres d'export selon le format
-                if fmt == 'mp3':
-                    audio.export(output_path, format='mp3', bitrate='192k')
-                elif fmt == 'wav':
-                    audio.export(output_path, format='wav')
-                else:
-                    audio.export(output_path, format=fmt)
-                
-                logger.info(f"Fichier sauvegardé: {output_path}")
-            except Exception as e:
-                logger.error(f"Erreur lors de la sauvegarde en {fmt}: {e}")
+        # Un format listé deux fois ferait écrire deux threads dans le même fichier
+        output_formats = list(dict.fromkeys(output_formats))
+        if not output_formats:
+            return
+        
+        # Chaque export lance son propre ffmpeg: on les exécute en parallèle
+        with ThreadPoolExecutor(max_workers=len(output_formats)) as executor:
+            list(executor.map(lambda fmt: self._export_one(audio, output_folder, output_name, fmt),
+                              output_formats))
+    
+    def _export_one(self, audio, output_folder, output_name, fmt):
+        """
+        Exporte l'audio dans un format (appelé depuis un thread)
+        
+        Args:
+            audio (AudioSegment): Audio à sauvegarder
+            output_folder (str): Dossier de sortie
+            output_name (str): Nom de base du fichier de sortie
+            fmt (str): Format de sortie
+        """
+        output_path = os.path.join(output_folder, f"{output_name}.{fmt}")
+        # Laisser ffmpeg utiliser tous les cœurs pour l'encodage (le WAV
+        # sans paramètres est écrit directement par pydub, sans ffmpeg)
+        ffmpeg_params = ['-threads', '0']
+        try:
+            # Paramètres d'export selon le format
+            if fmt == 'mp3':
+                audio.export(output_path, format='mp3', bitrate='192k', parameters=ffmpeg_params)
+            elif fmt == 'wav':
+                audio.export(output_path, format='wav')
+            else:
+                audio.export(output_path, format=fmt, parameters=ffmpeg_params)
+            
+            logger.info("Fichier sauvegardé: %s", output_path)
+        except Exception as e:
+            logger.error("Erreur lors de la sauvegarde en %s: %s", fmt, e)
+    
+    def _do_mix(self):
+        """
+        Mixe les fichiers de mix_files s'il y en a
+        
+        Returns:
+            AudioSegment: Audio mixé, ou None
+        """
+        if not self.mix_segments:
+            return None
+        logger.info("Mixage de %d fichiers", len(self.mix_segments))
+        return self._mix_numpy(self.mix_segments, self.mix_placements)
+    
+    def _do_concat(self):
+        """
+        Concatène les fichiers de concatenate_files s'il y en a
+        
+        Returns:
+            AudioSegment: Audio concaténé, ou None
+        """
+        if not self.concatenate_segments:
+            return None
+        logger.info("Concaténation de %d fichiers", len(self.concatenate_segments))
+        return self._concatenate(self.concatenate_segments)
     
     def run(self):
         """
@@ -313,28 +845,26 @@ class AudioPipeline:
         logger.info("Démarrage du pipeline audio")
         logger.info("=" * 50)
         
+        # Mode streaming: un seul fichier, traité par blocs
+        if self.config.get('stream_mode', False):
+            if self.run_stream():
+                logger.info("=" * 50)
+                logger.info("Pipeline terminé avec succès!")
+                logger.info("=" * 50)
+            return
+        
         # 1. Charger les fichiers audio
         self.load_audio_files()
         
         # 2. Traiter selon la nouvelle configuration (mix_files + concatenate_files)
         if self.mix_segments or self.concatenate_segments:
             # Nouveau format: mix_files et/ou concatenate_files
-            mixed_audio = None
-            concatenated_audio = None
-            
-            # Mixer les fichiers si présents
-            if self.mix_segments:
-                logger.info(f"Mixage de {len(self.mix_segments)} fichiers")
-                mixed_audio = self.mix_segments[0]
-                for audio in self.mix_segments[1:]:
-                    mixed_audio = mixed_audio.overlay(audio)
-            
-            # Concaténer les fichiers si présents
-            if self.concatenate_segments:
-                logger.info(f"Concaténation de {len(self.concatenate_segments)} fichiers")
-                concatenated_audio = self.concatenate_segments[0]
-                for audio in self.concatenate_segments[1:]:
-                    concatenated_audio += audio
+            # Le mix et la concaténation sont indépendants: on les lance en parallèle
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                future_mix = executor.submit(self._do_mix)
+                future_concat = executor.submit(self._do_concat)
+                mixed_audio = future_mix.result()
+                concatenated_audio = future_concat.result()
             
             # Combiner mix et concatenate si les deux existent
             if mixed_audio and concatenated_audio:
@@ -369,9 +899,240 @@ class AudioPipeline:
             output_name = self.config.get('output_name', 'result')
             self.save_audio(self.result, output_name)
         
+        # Libérer les segments gardés en cache
+        self._effect_cache.clear()
+        
         logger.info("=" * 50)
         logger.info("Pipeline terminé avec succès!")
         logger.info("=" * 50)
+    
+    def run_stream(self):
+        """
+        Traite un fichier unique par blocs, sans le charger entièrement en mémoire
+        
+        Le fichier (seule entrée de audio_files) est décodé par ffmpeg en PCM
+        16 bits, chaque bloc reçoit les effets puis est écrit immédiatement dans
+        les sorties. Seuls les effets de _STREAM_EFFECTS sont supportés;
+        mix_files et concatenate_files ne sont pas utilisés dans ce mode.
+        
+        Returns:
+            bool: True si le traitement a abouti
+        """
+        from pydub.utils import get_encoder_name, mediainfo
+        
+        input_folder = self.config.get('input_folder', 'input_audio')
+        audio_files = self.config.get('audio_files', [])
+        effects = self.config.get('effects', [])
+        chunk_seconds = self.config.get('stream_chunk_seconds', 60)
+        
+        if len(audio_files) != 1:
+            logger.error("Le mode streaming traite un seul fichier (audio_files)")
+            return False
+        
+        unsupported = [effect.get('type') for effect in effects
+                       if effect.get('type') not in self._STREAM_EFFECTS]
+        if unsupported:
+            logger.error("Effets non supportés en mode streaming: %s", unsupported)
+            return False
+        
+        file_path = os.path.join(input_folder, audio_files[0])
+        if not os.path.isfile(file_path):
+            logger.error("Le fichier %s n'existe pas", file_path)
+            raise FileNotFoundError(f"Fichier {file_path} introuvable")
+        
+        # mediainfo renvoie {} si ffprobe ne sait pas lire le fichier
+        info = mediainfo(file_path)
+        if 'sample_rate' not in info or 'channels' not in info:
+            logger.error("Format audio illisible pour %s (ffprobe)", audio_files[0])
+            return False
+        frame_rate = int(info['sample_rate'])
+        channels = int(info['channels'])
+        logger.info("Streaming de %s (%dHz, %d canaux) par blocs de %ss",
+                    audio_files[0], frame_rate, channels, chunk_seconds)
+        
+        # Les fondus de sortie ne s'appliquent qu'une fois la durée connue:
+        # on retient en fin de flux autant de trames brutes que le plus long
+        tail_frames = max((int(effect.get('fade_out', 0) * frame_rate / 1000) for effect in effects
+                           if effect.get('type') == 'fade'), default=0)
+        tail_frames = max(0, tail_frames)
+        
+        # Ouvrir les sorties d'abord: inutile de décoder si aucune n'est utilisable
+        sinks = self._open_stream_sinks(frame_rate, channels)
+        if not sinks:
+            logger.error("Aucune sortie n'a pu être ouverte")
+            return False
+        
+        decoder = subprocess.Popen(
+            [get_encoder_name(), '-v', 'error', '-i', file_path,
+             '-f', 's16le', '-acodec', 'pcm_s16le', '-ar', str(frame_rate), '-ac', str(channels), '-'],
+            stdout=subprocess.PIPE, stderr=subprocess.DEVNULL)
+        
+        chunk_bytes = max(1, int(chunk_seconds * frame_rate)) * channels * 2
+        # Trames déjà écrites; la traîne contient les suivantes, non traitées
+        position = 0
+        tail = np.zeros((0, channels), dtype=np.float32)
+        # Vrai seulement si tout le flux a été lu: sinon un code d'erreur de
+        # ffmpeg vient de la fermeture du tube, pas d'un échec de décodage
+        reached_eof = False
+        completed = False
+        try:
+            while sinks:
+                data = decoder.stdout.read(chunk_bytes)
+                if not data:
+                    reached_eof = True
+                    break
+                data = data[:len(data) - len(data) % (channels * 2)]
+                chunk = np.frombuffer(data, dtype=np.int16).astype(np.float32).reshape(-1, channels)
+                
+                # Traiter et écrire tout sauf la traîne réservée aux fondus de sortie
+                buffered = np.concatenate([tail, chunk])
+                split = max(0, len(buffered) - tail_frames)
+                block, tail = buffered[:split], buffered[split:]
+                for effect in effects:
+                    self._apply_block_effect(block, effect, frame_rate, position, None)
+                self._write_stream_sinks(sinks, block)
+                position += len(block)
+            
+            if reached_eof:
+                # Fin du flux: la durée totale est connue, la traîne reçoit les fondus de sortie
+                for effect in effects:
+                    self._apply_block_effect(tail, effect, frame_rate, position, position + len(tail))
+                self._write_stream_sinks(sinks, tail)
+                position += len(tail)
+            completed = reached_eof and bool(sinks)
+        finally:
+            decoder.stdout.close()
+            decode_failed = decoder.wait() != 0 and reached_eof
+            if decode_failed:
+                completed = False
+            self._close_stream_sinks(sinks, completed)
+        
+        if not sinks:
+            logger.error("Aucune sortie n'a pu être écrite")
+            return False
+        if decode_failed:
+            logger.error("Erreur ffmpeg lors du décodage de %s", audio_files[0])
+            return False
+        
+        logger.info("Fichier traité en streaming: %.1fs", position / frame_rate)
+        return True
+    
+    def _open_stream_sinks(self, frame_rate, channels):
+        """
+        Ouvre une sortie incrémentale par format demandé
+        
+        Args:
+            frame_rate (int): Fréquence d'échantillonnage
+            channels (int): Nombre de canaux
+            
+        Returns:
+            list: Tuples (fmt, output_path, writer) où writer est un wave.Wave_write
+                  pour le WAV, ou un processus ffmpeg lisant le PCM sur stdin
+        """
+        from pydub.utils import get_encoder_name
+        
+        output_folder = self.config.get('output_folder', 'output_audio')
+        output_formats = self.config.get('output_formats', ['mp3', 'wav'])
+        output_name = self.config.get('output_name', 'result')
+        
+        if not os.path.exists(output_folder):
+            os.makedirs(output_folder)
+            logger.info("Dossier de sortie créé: %s", output_folder)
+        
+        sinks = []
+        # Un format listé deux fois ouvrirait deux sorties sur le même fichier
+        for fmt in dict.fromkeys(output_formats):
+            output_path = os.path.join(output_folder, f"{output_name}.{fmt}")
+            try:
+                if fmt == 'wav':
+                    writer = wave.open(output_path, 'wb')
+                    writer.setnchannels(channels)
+                    writer.setsampwidth(2)
+                    writer.setframerate(frame_rate)
+                else:
+                    command = [get_encoder_name(), '-y', '-v', 'error',
+                               '-f', 's16le', '-ar', str(frame_rate), '-ac', str(channels), '-i', '-',
+                               '-threads', '0']
+                    if fmt == 'mp3':
+                        command += ['-b:a', '192k']
+                    writer = subprocess.Popen(command + [output_path], stdin=subprocess.PIPE,
+                                              stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+                sinks.append((fmt, output_path, writer))
+            except Exception as e:
+                logger.error("Erreur lors de la sauvegarde en %s: %s", fmt, e)
+        return sinks
+    
+    def _write_stream_sinks(self, sinks, samples):
+        """
+        Écrête un bloc en int16 et l'écrit dans toutes les sorties
+        
+        Une sortie en erreur (ffmpeg arrêté, disque plein, WAV au-delà de
+        4 Gio...) est retirée de sinks, sans interrompre les autres formats.
+        
+        Args:
+            sinks (list): Sorties ouvertes par _open_stream_sinks
+            samples (np.ndarray): Bloc float32 de forme (trames, canaux)
+        """
+        if not len(samples):
+            return
+        data = np.clip(samples, -32768, 32767).astype(np.int16).tobytes()
+        for sink in list(sinks):
+            fmt, output_path, writer = sink
+            try:
+                if fmt == 'wav':
+                    written = writer.tell() * writer.getnchannels() * writer.getsampwidth()
+                    if written + len(data) > _WAV_MAX_DATA_BYTES:
+                        raise ValueError("WAV limité à 4 Gio, fichier arrêté avant la limite")
+                    writer.writeframes(data)
+                else:
+                    writer.stdin.write(data)
+            except Exception as e:
+                logger.error("Erreur lors de la sauvegarde en %s: %s", fmt, e)
+                sinks.remove(sink)
+                self._discard_stream_sink(fmt, writer)
+    
+    def _discard_stream_sink(self, fmt, writer):
+        """
+        Libère une sortie abandonnée en cours de streaming
+        
+        Args:
+            fmt (str): Format de la sortie
+            writer: wave.Wave_write ou processus ffmpeg
+        """
+        try:
+            if fmt == 'wav':
+                writer.close()
+            else:
+                writer.stdin.close()
+        except Exception as e:
+            logger.error("Erreur lors de la fermeture de la sortie %s: %s", fmt, e)
+        if fmt != 'wav':
+            writer.wait()
+    
+    def _close_stream_sinks(self, sinks, completed=True):
+        """
+        Ferme les sorties et attend la fin des encodages ffmpeg
+        
+        Args:
+            sinks (list): Sorties ouvertes par _open_stream_sinks
+            completed (bool): False si le traitement a été interrompu,
+                              les fichiers sont alors signalés incomplets
+        """
+        for fmt, output_path, writer in sinks:
+            if not completed:
+                self._discard_stream_sink(fmt, writer)
+                logger.error("Fichier incomplet: %s", output_path)
+                continue
+            try:
+                if fmt == 'wav':
+                    writer.close()
+                else:
+                    writer.stdin.close()
+                    if writer.wait() != 0:
+                        raise RuntimeError(f"ffmpeg a échoué (code {writer.returncode})")
+                logger.info("Fichier sauvegardé: %s", output_path)
+            except Exception as e:
+                logger.error("Erreur lors de la sauvegarde en %s: %s", fmt, e)
 
 
 def main():
@@ -383,14 +1144,14 @@ def main():
         config_file = 'config.yaml'
         if len(sys.argv) > 1:
             config_file = sys.argv[1]
-            logger.info(f"Utilisation du fichier de configuration: {config_file}")
+            logger.info("Utilisation du fichier de configuration: %s", config_file)
         
         # Créer et exécuter le pipeline
         pipeline = AudioPipeline(config_file)
         pipeline.run()
         
     except Exception as e:
-        logger.error(f"Erreur fatale: {e}")
+        logger.error("Erreur fatale: %s", e)
         raise
 
 